@@ -1,30 +1,90 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, request, jsonify
+from flask.json.provider import DefaultJSONProvider
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import case, event, func, text, tuple_
+from sqlalchemy.engine import Engine
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import joinedload, load_only, selectinload
 from flask_cors import CORS
 from werkzeug.utils import secure_filename
-from werkzeug.security import generate_password_hash, check_password_hash
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerifyMismatchError
 from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+import math
 import os
+import shutil
+import sqlite3
+import time
 import uuid
 from PIL import Image
 import base64
 from io import BytesIO
-import json
+import orjson
+
+try:
+    import pyvips
+except ImportError:
+    pyvips = None
+
+try:
+    import gevent
+    from gevent import monkey as gevent_monkey
+except ImportError:
+    gevent = None
 
 app = Flask(__name__)
 CORS(app)
 
+class ORJSONProvider(DefaultJSONProvider):
+    """JSON provider backed by orjson; serializes datetimes natively"""
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=str, option=orjson.OPT_NAIVE_UTC).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app.json = ORJSONProvider(app)
+
 # Configuration
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 app.config['SQLALCHEMY_DATABASE_URI'] = 'sqlite:///bird_finder.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+    'pool_size': 20,
+    'max_overflow': 40,
+    'pool_pre_ping': True,
+    'connect_args': {'check_same_thread': False, 'timeout': 15}
+}
 
 db = SQLAlchemy(app)
 
-# Create upload directory
-os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
+@event.listens_for(Engine, 'connect')
+def set_sqlite_pragmas(dbapi_conn, connection_record):
+    """WAL lets readers proceed while a write is in flight; the default
+    rollback journal serializes every connection behind the writer"""
+    if isinstance(dbapi_conn, sqlite3.Connection):
+        cursor = dbapi_conn.cursor()
+        cursor.execute('PRAGMA journal_mode=WAL')
+        cursor.execute('PRAGMA synchronous=NORMAL')
+        cursor.execute('PRAGMA cache_size=-64000')
+        cursor.execute('PRAGMA mmap_size=268435456')
+        cursor.close()
+
+# Native JSON column type: the ORM returns dicts/lists directly, so no
+# app-side dumps/loads; stored as JSONB (indexable) on Postgres
+JSONColumn = db.JSON().with_variant(JSONB, 'postgresql')
+
+# Refuse decompression-bomb images well below Pillow's default ceiling
+Image.MAX_IMAGE_PIXELS = 50_000_000
+
+# Create upload directory; hoisted so the handlers skip the config dict lookup
+UPLOAD_DIR = app.config['UPLOAD_FOLDER']
+os.makedirs(UPLOAD_DIR, exist_ok=True)
 
 # Database Models
 class User(db.Model):
@@ -36,17 +96,21 @@ class User(db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationships
-    lost_birds = db.relationship('LostBird', backref='owner', lazy=True, foreign_keys='LostBird.user_id')
-    found_birds = db.relationship('FoundBird', backref='finder', lazy=True)
-    reports = db.relationship('SightingReport', backref='reporter', lazy=True)
+    lost_birds = db.relationship('LostBird', back_populates='owner', lazy=True, foreign_keys='LostBird.user_id')
+    found_birds = db.relationship('FoundBird', back_populates='finder', lazy=True)
+    reports = db.relationship('SightingReport', back_populates='reporter', lazy=True)
 
 class BirdSpecies(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    name_th = db.Column(db.String(100), nullable=False)
+    name_th = db.Column(db.String(100), nullable=False, unique=True)
     name_en = db.Column(db.String(100))
     description = db.Column(db.Text)
-    characteristics = db.Column(db.Text)  # JSON string
-    
+    characteristics = db.Column(JSONColumn)
+
+    # Relationships
+    lost_birds = db.relationship('LostBird', back_populates='species')
+    found_birds = db.relationship('FoundBird', back_populates='species')
+
 class LostBird(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     user_id = db.Column(db.Integer, db.ForeignKey('user.id'), nullable=False)
@@ -55,8 +119,8 @@ class LostBird(db.Model):
     # Bird details
     name = db.Column(db.String(100), nullable=False)
     description = db.Column(db.Text, nullable=False)
-    characteristics = db.Column(db.Text)  # JSON string for colors, size, etc.
-    photos = db.Column(db.Text)  # JSON array of photo URLs
+    characteristics = db.Column(JSONColumn)  # colors, size, etc.
+    photos = db.Column(JSONColumn)  # array of photo URLs
     
     # Location and time
     last_seen_location = db.Column(db.String(200), nullable=False)
@@ -65,17 +129,28 @@ class LostBird(db.Model):
     lost_date = db.Column(db.DateTime, nullable=False)
     
     # Contact and reward
-    contact_info = db.Column(db.Text)  # JSON string
+    contact_info = db.Column(JSONColumn)
     reward_amount = db.Column(db.Integer, default=0)  # in THB
     
     # Status
     status = db.Column(db.String(20), default='lost')  # lost, found, reunited
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    # Listing-shaped response payload, serialized once at write time
+    cached_json = db.Column(db.LargeBinary)
     
     # Relationships
-    species = db.relationship('BirdSpecies', backref='lost_birds')
-    sightings = db.relationship('SightingReport', backref='lost_bird', lazy=True)
+    owner = db.relationship('User', back_populates='lost_birds', foreign_keys=[user_id])
+    species = db.relationship('BirdSpecies', back_populates='lost_birds')
+    sightings = db.relationship('SightingReport', back_populates='lost_bird', lazy=True)
+
+    # Indexes for the hot list query (filter by status, sort by created_at)
+    # and the bounding-box location filter
+    __table_args__ = (
+        db.Index('ix_lostbird_status_created', 'status', 'created_at'),
+        db.Index('ix_lostbird_latlng', 'last_seen_lat', 'last_seen_lng'),
+    )
 
 class FoundBird(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -84,8 +159,8 @@ class FoundBird(db.Model):
     
     # Bird details
     description = db.Column(db.Text, nullable=False)
-    characteristics = db.Column(db.Text)  # JSON string
-    photos = db.Column(db.Text)  # JSON array of photo URLs
+    characteristics = db.Column(JSONColumn)
+    photos = db.Column(JSONColumn)  # array of photo URLs
     
     # Location and time
     found_location = db.Column(db.String(200), nullable=False)
@@ -94,14 +169,20 @@ class FoundBird(db.Model):
     found_date = db.Column(db.DateTime, nullable=False)
     
     # Contact
-    contact_info = db.Column(db.Text)  # JSON string
+    contact_info = db.Column(JSONColumn)
     
     # Status
     status = db.Column(db.String(20), default='found')  # found, claimed
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     # Relationships
-    species = db.relationship('BirdSpecies', backref='found_birds')
+    finder = db.relationship('User', back_populates='found_birds')
+    species = db.relationship('BirdSpecies', back_populates='found_birds')
+
+    __table_args__ = (
+        db.Index('ix_foundbird_status_created', 'status', 'created_at'),
+        db.Index('ix_foundbird_latlng', 'found_lat', 'found_lng'),
+    )
 
 class SightingReport(db.Model):
     id = db.Column(db.Integer, primary_key=True)
@@ -114,32 +195,186 @@ class SightingReport(db.Model):
     lng = db.Column(db.Float)
     sighting_date = db.Column(db.DateTime, nullable=False)
     description = db.Column(db.Text)
-    photos = db.Column(db.Text)  # JSON array
+    photos = db.Column(JSONColumn)  # array of photo URLs
     confidence_level = db.Column(db.Integer, default=5)  # 1-10 scale
     
     # Status
     verified = db.Column(db.Boolean, default=False)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
 
+    # Relationships
+    lost_bird = db.relationship('LostBird', back_populates='sightings')
+    reporter = db.relationship('User', back_populates='reports')
+
+    __table_args__ = (
+        db.Index('ix_sighting_bird_date', 'lost_bird_id', 'sighting_date'),
+    )
+
+def build_listing_json(bird, connection):
+    """Serialize the listing-shaped payload for one lost bird"""
+    owner = connection.execute(
+        db.select(User.name, User.phone).where(User.id == bird.user_id)
+    ).first()
+    species = None
+    if bird.species_id is not None:
+        species_row = connection.execute(
+            db.select(BirdSpecies.name_th, BirdSpecies.name_en)
+            .where(BirdSpecies.id == bird.species_id)
+        ).first()
+        if species_row is not None:
+            species = {'name_th': species_row.name_th, 'name_en': species_row.name_en}
+
+    return orjson.dumps({
+        'id': bird.id,
+        'name': bird.name,
+        'description': bird.description,
+        'characteristics': bird.characteristics or {},
+        'photos': bird.photos or [],
+        'last_seen_location': bird.last_seen_location,
+        'last_seen_lat': bird.last_seen_lat,
+        'last_seen_lng': bird.last_seen_lng,
+        'lost_date': bird.lost_date,
+        'reward_amount': bird.reward_amount,
+        'status': bird.status,
+        'created_at': bird.created_at,
+        'owner': {
+            'name': owner.name if owner else None,
+            'phone': owner.phone if owner else None
+        },
+        'species': species
+    }, default=str, option=orjson.OPT_NAIVE_UTC)
+
+@event.listens_for(LostBird, 'after_insert')
+@event.listens_for(LostBird, 'after_update')
+def refresh_cached_json(mapper, connection, target):
+    connection.execute(
+        db.update(LostBird)
+        .where(LostBird.id == target.id)
+        .values(cached_json=build_listing_json(target, connection))
+    )
+
+@event.listens_for(User, 'after_update')
+def invalidate_owner_cached_json(mapper, connection, target):
+    # The cached payload embeds the owner's name/phone; drop it so the
+    # listing rebuilds it lazily on the next read
+    connection.execute(
+        db.update(LostBird)
+        .where(LostBird.user_id == target.id)
+        .values(cached_json=None)
+    )
+
 # Utility Functions
+# Argon2id costs tuned for ~50ms per hash; werkzeug's PBKDF2 default burns
+# ~200ms of CPU per login and pins a worker for the duration
+password_hasher = PasswordHasher(time_cost=2, memory_cost=65536, parallelism=2)
+
+def verify_password(stored_hash, password):
+    """Verify a password, falling back to legacy werkzeug PBKDF2 hashes"""
+    try:
+        return password_hasher.verify(stored_hash, password)
+    except VerifyMismatchError:
+        return False
+    except InvalidHashError:
+        return check_password_hash(stored_hash, password)
+
+def encode_cursor(created_at, row_id):
+    """Build an opaque keyset-pagination cursor from the last row of a page"""
+    raw = f'{created_at.isoformat()}|{row_id}'.encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+def decode_cursor(cursor):
+    created_at, _, row_id = base64.urlsafe_b64decode(cursor.encode()).decode().partition('|')
+    return datetime.fromisoformat(created_at), int(row_id)
+
+ALLOWED_EXTENSIONS = frozenset(('png', 'jpg', 'jpeg', 'gif'))
+
+# Magic-byte prefixes for the allowed formats; the filename extension is
+# client-controlled so the file content gets checked too
+IMAGE_SIGNATURES = (
+    b'\x89PNG\r\n\x1a\n',  # PNG
+    b'\xff\xd8\xff',       # JPEG
+    b'GIF87a',             # GIF
+    b'GIF89a',
+)
+
 def allowed_file(filename):
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif'}
-    return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
+    return os.path.splitext(filename)[1][1:].lower() in ALLOWED_EXTENSIONS
+
+def parse_iso_datetime(value):
+    """Parse an ISO-8601 timestamp; fromisoformat handles the Z suffix
+    natively on Python 3.11+ without the str copy from replace()"""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return datetime.fromisoformat(value.replace('Z', '+00:00'))
 
 def save_uploaded_file(file):
     if file and allowed_file(file.filename):
+        header = file.stream.read(8)
+        file.stream.seek(0)
+        if not header.startswith(IMAGE_SIGNATURES):
+            return None
         filename = secure_filename(file.filename)
         unique_filename = str(uuid.uuid4()) + '_' + filename
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], unique_filename)
-        file.save(filepath)
+        filepath = os.path.join(UPLOAD_DIR, unique_filename)
+        # Stream to disk in 1 MiB chunks instead of file.save, which can
+        # buffer the whole upload in memory first
+        with open(filepath, 'wb') as out:
+            shutil.copyfileobj(file.stream, out, 1 << 20)
         return unique_filename
     return None
 
 def resize_image(filepath, max_size=800):
-    """Resize image while maintaining aspect ratio"""
+    """Resize image while maintaining aspect ratio. The upload URL is
+    public before optimization finishes, so both paths write to a temp
+    file and swap atomically rather than truncating the original in place"""
+    ext = os.path.splitext(filepath)[1].lower()
+    tmp_path = filepath + '.tmp' + ext
+
+    if pyvips is not None:
+        # libvips streams the source instead of decoding the full bitmap
+        # into RAM, and its resampling is SIMD-parallel
+        try:
+            thumb = pyvips.Image.thumbnail(filepath, max_size, height=max_size, size='down')
+            if ext in ('.jpg', '.jpeg'):
+                thumb.write_to_file(tmp_path, Q=85, optimize_coding=True, strip=True)
+            else:
+                thumb.write_to_file(tmp_path)
+            os.replace(tmp_path, filepath)
+            return
+        except pyvips.Error:
+            pass  # fall back to Pillow below
+
     with Image.open(filepath) as img:
+        if img.format == 'JPEG':
+            # Let libjpeg decode straight to a 1/2, 1/4 or 1/8 size via
+            # scale_num/scale_denom instead of decoding every pixel and
+            # throwing most of them away; thumbnail() does the final pass
+            img.draft('RGB', (max_size * 2, max_size * 2))
         img.thumbnail((max_size, max_size), Image.Resampling.LANCZOS)
-        img.save(filepath, optimize=True, quality=85)
+        img.save(tmp_path, optimize=True, quality=85)
+    os.replace(tmp_path, filepath)
+
+# Background worker pool so image optimization doesn't block the request
+resize_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='resize')
+
+def _resize_and_log(filepath):
+    # Background failures (corrupt image, disk full) have no request to
+    # surface in, so log them instead of letting them vanish
+    try:
+        resize_image(filepath)
+    except Exception:
+        app.logger.exception('Background resize failed for %s', filepath)
+
+def submit_resize(filepath):
+    """Queue a resize without stalling the serving worker. Under gevent's
+    monkey patching ThreadPoolExecutor threads are greenlets, so a CPU-bound
+    resize there would block every request in flight; hand it to the hub's
+    native OS thread pool instead"""
+    if gevent is not None and gevent_monkey.is_module_patched('threading'):
+        gevent.get_hub().threadpool.spawn(_resize_and_log, filepath)
+    else:
+        resize_executor.submit(_resize_and_log, filepath)
 
 # Authentication Routes
 @app.route('/api/register', methods=['POST'])
@@ -160,7 +395,7 @@ def register():
         # Create new user
         user = User(
             email=data['email'],
-            password_hash=generate_password_hash(data['password']),
+            password_hash=password_hasher.hash(data['password']),
             name=data['name'],
             phone=data.get('phone', '')
         )
@@ -182,7 +417,12 @@ def login():
         data = request.get_json()
         user = User.query.filter_by(email=data.get('email')).first()
         
-        if user and check_password_hash(user.password_hash, data.get('password')):
+        if user and verify_password(user.password_hash, data.get('password')):
+            # Upgrade legacy PBKDF2 hashes on successful login
+            if not user.password_hash.startswith('$argon2'):
+                user.password_hash = password_hasher.hash(data['password'])
+                db.session.commit()
+
             return jsonify({
                 'message': 'Login successful',
                 'user_id': user.id,
@@ -207,20 +447,20 @@ def create_lost_bird():
                 return jsonify({'error': f'{field} is required'}), 400
         
         # Parse lost_date
-        lost_date = datetime.fromisoformat(data['lost_date'].replace('Z', '+00:00'))
+        lost_date = parse_iso_datetime(data['lost_date'])
         
         lost_bird = LostBird(
             user_id=data['user_id'],
             species_id=data.get('species_id'),
             name=data['name'],
             description=data['description'],
-            characteristics=json.dumps(data.get('characteristics', {})),
-            photos=json.dumps(data.get('photos', [])),
+            characteristics=data.get('characteristics', {}),
+            photos=data.get('photos', []),
             last_seen_location=data['last_seen_location'],
             last_seen_lat=data.get('last_seen_lat'),
             last_seen_lng=data.get('last_seen_lng'),
             lost_date=lost_date,
-            contact_info=json.dumps(data.get('contact_info', {})),
+            contact_info=data.get('contact_info', {}),
             reward_amount=data.get('reward_amount', 0)
         )
         
@@ -239,75 +479,97 @@ def create_lost_bird():
 def get_lost_birds():
     try:
         page = request.args.get('page', 1, type=int)
-        per_page = request.args.get('per_page', 20, type=int)
+        # Clamp like paginate(error_out=False) does; per_page=0 would make
+        # the keyset branch report has_next on an empty page and crash
+        # building the cursor
+        per_page = max(request.args.get('per_page', 20, type=int), 1)
         status = request.args.get('status', 'lost')
         
-        query = LostBird.query.filter_by(status=status)
-        
-        # Search filters
+        # The response body for each row is precomputed in cached_json, so
+        # the hot path fetches just that plus the keyset columns; the other
+        # columns stay deferred and only load for rows whose cache is cold
+        query = LostBird.query.options(
+            load_only(LostBird.id, LostBird.created_at, LostBird.cached_json)
+        ).filter_by(status=status)
+
+        # Search filters: token match against the trigger-maintained FTS5
+        # index instead of three LIKE '%...%' scans. The query is quoted as
+        # a phrase so user input can't hit FTS5 operator syntax
         search = request.args.get('search')
         if search:
-            query = query.filter(
-                LostBird.name.contains(search) | 
-                LostBird.description.contains(search) |
-                LostBird.last_seen_location.contains(search)
-            )
+            match = '"' + search.replace('"', '""') + '"'
+            matched_ids = db.session.execute(
+                text('SELECT rowid FROM lost_bird_fts WHERE lost_bird_fts MATCH :q'),
+                {'q': match}
+            ).scalars().all()
+            query = query.filter(LostBird.id.in_(matched_ids))
         
         # Location filter (within radius)
         lat = request.args.get('lat', type=float)
         lng = request.args.get('lng', type=float)
         radius = request.args.get('radius', 50, type=float)  # km
         
-        if lat and lng:
-            # Simple bounding box filter (more accurate would use Haversine formula)
+        if lat is not None and lng is not None:
+            # Bounding box filter on the indexed lat/lng columns. Degrees of
+            # longitude shrink by cos(latitude); clamp near the poles where
+            # the factor approaches zero
             lat_range = radius / 111  # Approximate degrees per km
-            lng_range = radius / (111 * abs(lat))
-            
+            lng_range = radius / (111 * max(math.cos(math.radians(lat)), 0.01))
+
             query = query.filter(
                 LostBird.last_seen_lat.between(lat - lat_range, lat + lat_range),
                 LostBird.last_seen_lng.between(lng - lng_range, lng + lng_range)
             )
         
-        pagination = query.order_by(LostBird.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        
-        birds = []
-        for bird in pagination.items:
-            bird_data = {
-                'id': bird.id,
-                'name': bird.name,
-                'description': bird.description,
-                'characteristics': json.loads(bird.characteristics) if bird.characteristics else {},
-                'photos': json.loads(bird.photos) if bird.photos else [],
-                'last_seen_location': bird.last_seen_location,
-                'last_seen_lat': bird.last_seen_lat,
-                'last_seen_lng': bird.last_seen_lng,
-                'lost_date': bird.lost_date.isoformat(),
-                'reward_amount': bird.reward_amount,
-                'status': bird.status,
-                'created_at': bird.created_at.isoformat(),
-                'owner': {
-                    'name': bird.owner.name,
-                    'phone': bird.owner.phone
-                },
-                'species': {
-                    'name_th': bird.species.name_th,
-                    'name_en': bird.species.name_en
-                } if bird.species else None
-            }
-            birds.append(bird_data)
-        
-        return jsonify({
-            'birds': birds,
-            'pagination': {
+        query = query.order_by(LostBird.created_at.desc(), LostBird.id.desc())
+
+        # Keyset pagination by default: seek on (created_at, id) instead of
+        # LIMIT/OFFSET plus a COUNT(*) over the whole filtered set. Legacy
+        # clients that send ?page= still get the offset behaviour
+        if 'page' in request.args:
+            pagination = query.paginate(page=page, per_page=per_page, error_out=False)
+            items = pagination.items
+            page_info = {
                 'page': page,
                 'pages': pagination.pages,
                 'total': pagination.total,
                 'has_next': pagination.has_next,
                 'has_prev': pagination.has_prev
             }
-        }), 200
+        else:
+            cursor = request.args.get('cursor')
+            if cursor:
+                cur_ts, cur_id = decode_cursor(cursor)
+                query = query.filter(
+                    tuple_(LostBird.created_at, LostBird.id) < (cur_ts, cur_id)
+                )
+            items = query.limit(per_page + 1).all()
+            has_next = len(items) > per_page
+            items = items[:per_page]
+            page_info = {
+                'per_page': per_page,
+                'has_next': has_next,
+                'next_cursor': encode_cursor(items[-1].created_at, items[-1].id) if has_next else None
+            }
+
+        # Stitch the precomputed row payloads together as raw bytes; rows
+        # written before the cache existed (or invalidated by an owner
+        # update) are rebuilt and healed in place
+        chunks = []
+        healed = False
+        for bird in items:
+            payload = bird.cached_json
+            if payload is None:
+                payload = build_listing_json(bird, db.session.connection())
+                bird.cached_json = payload
+                healed = True
+            chunks.append(payload)
+        if healed:
+            db.session.commit()
+
+        body = (b'{"birds":[' + b','.join(chunks) + b'],"pagination":'
+                + orjson.dumps(page_info) + b'}')
+        return Response(body, mimetype='application/json'), 200
         
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -315,22 +577,26 @@ def get_lost_birds():
 @app.route('/api/lost-birds/<int:bird_id>', methods=['GET'])
 def get_lost_bird(bird_id):
     try:
-        bird = LostBird.query.get_or_404(bird_id)
+        bird = LostBird.query.options(
+            joinedload(LostBird.owner),
+            joinedload(LostBird.species),
+            selectinload(LostBird.sightings).joinedload(SightingReport.reporter)
+        ).get_or_404(bird_id)
         
         bird_data = {
             'id': bird.id,
             'name': bird.name,
             'description': bird.description,
-            'characteristics': json.loads(bird.characteristics) if bird.characteristics else {},
-            'photos': json.loads(bird.photos) if bird.photos else [],
+            'characteristics': bird.characteristics or {},
+            'photos': bird.photos or [],
             'last_seen_location': bird.last_seen_location,
             'last_seen_lat': bird.last_seen_lat,
             'last_seen_lng': bird.last_seen_lng,
-            'lost_date': bird.lost_date.isoformat(),
-            'contact_info': json.loads(bird.contact_info) if bird.contact_info else {},
+            'lost_date': bird.lost_date,
+            'contact_info': bird.contact_info or {},
             'reward_amount': bird.reward_amount,
             'status': bird.status,
-            'created_at': bird.created_at.isoformat(),
+            'created_at': bird.created_at,
             'owner': {
                 'id': bird.owner.id,
                 'name': bird.owner.name,
@@ -349,9 +615,9 @@ def get_lost_bird(bird_id):
                     'location': s.location,
                     'lat': s.lat,
                     'lng': s.lng,
-                    'sighting_date': s.sighting_date.isoformat(),
+                    'sighting_date': s.sighting_date,
                     'description': s.description,
-                    'photos': json.loads(s.photos) if s.photos else [],
+                    'photos': s.photos or [],
                     'confidence_level': s.confidence_level,
                     'verified': s.verified,
                     'reporter': s.reporter.name
@@ -376,19 +642,19 @@ def create_found_bird():
             if not data.get(field):
                 return jsonify({'error': f'{field} is required'}), 400
         
-        found_date = datetime.fromisoformat(data['found_date'].replace('Z', '+00:00'))
+        found_date = parse_iso_datetime(data['found_date'])
         
         found_bird = FoundBird(
             user_id=data['user_id'],
             species_id=data.get('species_id'),
             description=data['description'],
-            characteristics=json.dumps(data.get('characteristics', {})),
-            photos=json.dumps(data.get('photos', [])),
+            characteristics=data.get('characteristics', {}),
+            photos=data.get('photos', []),
             found_location=data['found_location'],
             found_lat=data.get('found_lat'),
             found_lng=data.get('found_lng'),
             found_date=found_date,
-            contact_info=json.dumps(data.get('contact_info', {}))
+            contact_info=data.get('contact_info', {})
         )
         
         db.session.add(found_bird)
@@ -407,42 +673,45 @@ def get_found_birds():
     try:
         page = request.args.get('page', 1, type=int)
         per_page = request.args.get('per_page', 20, type=int)
-        
-        query = FoundBird.query.filter_by(status='found')
-        
-        pagination = query.order_by(FoundBird.created_at.desc()).paginate(
-            page=page, per_page=per_page, error_out=False
-        )
-        
-        birds = []
-        for bird in pagination.items:
-            bird_data = {
-                'id': bird.id,
-                'description': bird.description,
-                'characteristics': json.loads(bird.characteristics) if bird.characteristics else {},
-                'photos': json.loads(bird.photos) if bird.photos else [],
-                'found_location': bird.found_location,
-                'found_lat': bird.found_lat,
-                'found_lng': bird.found_lng,
-                'found_date': bird.found_date.isoformat(),
-                'status': bird.status,
-                'created_at': bird.created_at.isoformat(),
-                'finder': {
-                    'name': bird.finder.name,
-                    'phone': bird.finder.phone
-                }
-            }
-            birds.append(bird_data)
-        
-        return jsonify({
-            'birds': birds,
-            'pagination': {
-                'page': page,
-                'pages': pagination.pages,
-                'total': pagination.total
-            }
-        }), 200
-        
+
+        # Assemble the page in SQL with the JSON1 functions so the DB hands
+        # back one ready-to-send document; no rows are materialized in Python
+        birds_json = db.session.execute(text("""
+            SELECT json_group_array(json(bird)) FROM (
+                SELECT json_object(
+                    'id', fb.id,
+                    'description', fb.description,
+                    'characteristics', json(coalesce(fb.characteristics, '{}')),
+                    'photos', json(coalesce(fb.photos, '[]')),
+                    'found_location', fb.found_location,
+                    'found_lat', fb.found_lat,
+                    'found_lng', fb.found_lng,
+                    'found_date', strftime('%Y-%m-%dT%H:%M:%f', fb.found_date) || '+00:00',
+                    'status', fb.status,
+                    'created_at', strftime('%Y-%m-%dT%H:%M:%f', fb.created_at) || '+00:00',
+                    'finder', json_object('name', u.name, 'phone', u.phone)
+                ) AS bird
+                FROM found_bird fb
+                JOIN "user" u ON u.id = fb.user_id
+                WHERE fb.status = 'found'
+                ORDER BY fb.created_at DESC
+                LIMIT :lim OFFSET :off
+            )
+        """), {'lim': per_page, 'off': (page - 1) * per_page}).scalar() or '[]'
+
+        total = db.session.execute(text(
+            "SELECT COUNT(*) FROM found_bird WHERE status = 'found'"
+        )).scalar()
+
+        pagination_json = orjson.dumps({
+            'page': page,
+            'pages': math.ceil(total / per_page) if per_page else 0,
+            'total': total
+        }).decode()
+
+        body = '{"birds":%s,"pagination":%s}' % (birds_json, pagination_json)
+        return Response(body, mimetype='application/json'), 200
+
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -457,7 +726,7 @@ def create_sighting():
             if not data.get(field):
                 return jsonify({'error': f'{field} is required'}), 400
         
-        sighting_date = datetime.fromisoformat(data['sighting_date'].replace('Z', '+00:00'))
+        sighting_date = parse_iso_datetime(data['sighting_date'])
         
         sighting = SightingReport(
             lost_bird_id=data['lost_bird_id'],
@@ -467,7 +736,7 @@ def create_sighting():
             lng=data.get('lng'),
             sighting_date=sighting_date,
             description=data.get('description', ''),
-            photos=json.dumps(data.get('photos', [])),
+            photos=data.get('photos', []),
             confidence_level=data.get('confidence_level', 5)
         )
         
@@ -495,13 +764,16 @@ def upload_file():
         
         filename = save_uploaded_file(file)
         if filename:
-            filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-            resize_image(filepath)  # Optimize image size
-            
+            filepath = os.path.join(UPLOAD_DIR, filename)
+            # Optimize in the background; /api/uploads/<filename> serves the
+            # original until the resized file replaces it in place
+            submit_resize(filepath)
+
             return jsonify({
                 'message': 'File uploaded successfully',
                 'filename': filename,
-                'url': f'/api/uploads/{filename}'
+                'url': f'/api/uploads/{filename}',
+                'optimized': False
             }), 200
         
         return jsonify({'error': 'Invalid file type'}), 400
@@ -512,12 +784,24 @@ def upload_file():
 @app.route('/api/uploads/<filename>')
 def uploaded_file(filename):
     from flask import send_from_directory
-    return send_from_directory(app.config['UPLOAD_FOLDER'], filename)
+    return send_from_directory(UPLOAD_DIR, filename)
 
 # Bird Species Routes
+# The species table is static after seeding, so cache the built response
+# in-process and skip the query + per-row JSON parse on hits
+SPECIES_CACHE_TTL = 3600
+_species_cache = {'payload': None, 'expires': 0.0}
+
+def invalidate_species_cache():
+    _species_cache['payload'] = None
+    _species_cache['expires'] = 0.0
+
 @app.route('/api/species', methods=['GET'])
 def get_species():
     try:
+        if _species_cache['payload'] is not None and time.monotonic() < _species_cache['expires']:
+            return jsonify(_species_cache['payload']), 200
+
         species = BirdSpecies.query.all()
         species_list = [
             {
@@ -525,13 +809,16 @@ def get_species():
                 'name_th': s.name_th,
                 'name_en': s.name_en,
                 'description': s.description,
-                'characteristics': json.loads(s.characteristics) if s.characteristics else {}
+                'characteristics': s.characteristics or {}
             }
             for s in species
         ]
-        
+
+        _species_cache['payload'] = species_list
+        _species_cache['expires'] = time.monotonic() + SPECIES_CACHE_TTL
+
         return jsonify(species_list), 200
-        
+
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -539,19 +826,27 @@ def get_species():
 @app.route('/api/stats', methods=['GET'])
 def get_statistics():
     try:
-        total_lost = LostBird.query.count()
-        total_found = FoundBird.query.count()
-        total_reunited = LostBird.query.filter_by(status='reunited').count()
-        total_sightings = SightingReport.query.count()
-        
-        # Recent activity
-        recent_lost = LostBird.query.filter(
-            LostBird.created_at >= datetime.utcnow() - timedelta(days=30)
-        ).count()
-        
-        recent_found = FoundBird.query.filter(
-            FoundBird.created_at >= datetime.utcnow() - timedelta(days=30)
-        ).count()
+        cutoff = datetime.utcnow() - timedelta(days=30)
+
+        # Conditional aggregates: one scan per table instead of one
+        # COUNT(*) round-trip per statistic
+        total_lost, total_reunited, recent_lost = db.session.query(
+            func.count(LostBird.id),
+            func.sum(case((LostBird.status == 'reunited', 1), else_=0)),
+            func.sum(case((LostBird.created_at >= cutoff, 1), else_=0))
+        ).one()
+
+        total_found, recent_found = db.session.query(
+            func.count(FoundBird.id),
+            func.sum(case((FoundBird.created_at >= cutoff, 1), else_=0))
+        ).one()
+
+        total_sightings = db.session.query(func.count(SightingReport.id)).scalar()
+
+        # SUM over an empty table yields NULL
+        total_reunited = total_reunited or 0
+        recent_lost = recent_lost or 0
+        recent_found = recent_found or 0
         
         return jsonify({
             'total_lost': total_lost,
@@ -567,10 +862,55 @@ def get_statistics():
         return jsonify({'error': str(e)}), 500
 
 # Database initialization
+def create_search_index():
+    """Create the FTS5 full-text index over lost_bird and the triggers
+    that keep it in sync"""
+    fts_existed = db.session.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'lost_bird_fts'"
+    )).first() is not None
+
+    db.session.execute(text("""
+        CREATE VIRTUAL TABLE IF NOT EXISTS lost_bird_fts USING fts5(
+            name, description, location,
+            content='lost_bird', content_rowid='id'
+        )
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS lost_bird_fts_ai AFTER INSERT ON lost_bird BEGIN
+            INSERT INTO lost_bird_fts(rowid, name, description, location)
+            VALUES (new.id, new.name, new.description, new.last_seen_location);
+        END
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS lost_bird_fts_ad AFTER DELETE ON lost_bird BEGIN
+            INSERT INTO lost_bird_fts(lost_bird_fts, rowid, name, description, location)
+            VALUES ('delete', old.id, old.name, old.description, old.last_seen_location);
+        END
+    """))
+    db.session.execute(text("""
+        CREATE TRIGGER IF NOT EXISTS lost_bird_fts_au AFTER UPDATE ON lost_bird BEGIN
+            INSERT INTO lost_bird_fts(lost_bird_fts, rowid, name, description, location)
+            VALUES ('delete', old.id, old.name, old.description, old.last_seen_location);
+            INSERT INTO lost_bird_fts(rowid, name, description, location)
+            VALUES (new.id, new.name, new.description, new.last_seen_location);
+        END
+    """))
+
+    if not fts_existed:
+        # Backfill rows that predate the index. The triggers only cover
+        # writes from here on, and an external-content FTS table that has
+        # diverged from its content table corrupts on the next trigger fire
+        db.session.execute(text(
+            "INSERT INTO lost_bird_fts(lost_bird_fts) VALUES ('rebuild')"
+        ))
+
+    db.session.commit()
+
 def init_db():
     """Initialize database and create sample data"""
     db.create_all()
-    
+    create_search_index()
+
     # Create sample bird species
     if not BirdSpecies.query.first():
         sample_species = [
@@ -578,40 +918,45 @@ def init_db():
                 'name_th': 'นกแก้วโฟรพัส',
                 'name_en': 'Rose-ringed Parakeet',
                 'description': 'นกแก้วขนาดกลาง สีเขียว มีแถบสีชมพูรอบคอ',
-                'characteristics': json.dumps({
+                'characteristics': {
                     'size': 'medium',
                     'colors': ['green', 'pink', 'black'],
                     'habitat': 'urban, gardens'
-                })
+                }
             },
             {
                 'name_th': 'นกกรงหัวจุก',
                 'name_en': 'Red-whiskered Bulbul',
                 'description': 'นกขนาดเล็ก มีหงอกสีดำ แก้มสีแดง',
-                'characteristics': json.dumps({
+                'characteristics': {
                     'size': 'small',
                     'colors': ['brown', 'white', 'red', 'black'],
                     'habitat': 'gardens, parks'
-                })
+                }
             },
             {
                 'name_th': 'นกขุนทอง',
                 'name_en': 'Oriental Magpie-Robin',
                 'description': 'นกสีดำขาว ร้องเพลงไพเราะ',
-                'characteristics': json.dumps({
+                'characteristics': {
                     'size': 'small',
                     'colors': ['black', 'white'],
                     'habitat': 'gardens, urban areas'
-                })
+                }
             }
         ]
         
-        for species_data in sample_species:
-            species = BirdSpecies(**species_data)
-            db.session.add(species)
-        
-        db.session.commit()
-        print("Sample bird species created!")
+        # Single multi-row INSERT instead of one add() per species. Every
+        # gunicorn worker runs init_db at boot, so two workers can both pass
+        # the empty-table check on a fresh database; the unique constraint
+        # on name_th makes the losers fail here instead of double-seeding
+        try:
+            db.session.bulk_insert_mappings(BirdSpecies, sample_species)
+            db.session.commit()
+            invalidate_species_cache()
+            print("Sample bird species created!")
+        except IntegrityError:
+            db.session.rollback()
 
 if __name__ == '__main__':
     with app.app_context():
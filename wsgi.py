@@ -0,0 +1,13 @@
+from gevent import monkey
+monkey.patch_all()
+
+import os
+
+from bird_finder_backend import app, init_db
+
+with app.app_context():
+    init_db()
+
+if __name__ == '__main__':
+    port = int(os.environ.get('PORT', 5000))
+    app.run(debug=False, host='0.0.0.0', port=port)